@@ -4,6 +4,9 @@ from langchain_ollama import OllamaEmbeddings
 import re
 import ollama
 
+COURSE_RE = re.compile(r'\b[a-z]{2,3}\d{3}\b')
+PROGRAM_RE = re.compile(r'\b[a-z]{2,3}\d{2}\b')
+
 
 class MDUBot:
     def __init__(self, model_name="REPLACE_WITH_LLM", embed_model_name="REPLACE_WITH_EMBEDDING_MODEL", persist_path="./chroma"): # Change persist_path if needed
@@ -19,9 +22,9 @@ class MDUBot:
                 break
 
             prompt = prompt.lower().strip()
-            course_code = re.findall(r'\b[a-z]{2,3}\d{3}\b', prompt)
+            course_code = COURSE_RE.findall(prompt)
             num_codes = len(course_code)
-            program_code = re.findall(r'\b[a-z]{2,3}\d{2}\b', prompt)
+            program_code = PROGRAM_RE.findall(prompt)
             num_codes = len(program_code) if num_codes == 0 else num_codes
             program_code = program_code
 
@@ -4,19 +4,123 @@ See README.md for usage instructions and documentation.
 
 Author: henfal -- falkis@gmail.com
 """
-import requests
-import time
+import aiofiles
+import aiohttp
+import asyncio
+import concurrent.futures
 import random
-import json
+import orjson
 import logging
+import re
 from typing import Optional, Dict, Any, List, Literal
-from bs4 import BeautifulSoup
-from datetime import datetime
+from lxml import etree
+import lxml.html
 import os
 from pathlib import Path
-from collections import defaultdict
+from collections import defaultdict, namedtuple
 from tqdm import tqdm
 import argparse
+import ahocorasick
+
+SEMESTER_RE = re.compile(r"(Hösttermin|Vårtermin) (\d{4})")
+
+# Newest-version bookkeeping entry; a namedtuple is far lighter than the
+# throwaway dicts the defaultdict factory used to allocate per code
+Version = namedtuple("Version", "code title name giltig_fran id is_active")
+
+# Swapping the User-Agent header on every request defeats connection reuse
+# for no anti-bot benefit; rotate every N fetches instead
+USER_AGENT_ROTATE_EVERY = 50
+
+# Coalesce JSONL records into writes of roughly this size instead of one
+# syscall per record
+WRITE_BUFFER_SIZE = 64 * 1024
+
+# XPath expressions compiled once at import; each extract_* call then walks the
+# document in a handful of C-level passes instead of repeated find/find_all DFS
+H1_XPATH = etree.XPath("//h1[contains(@class, 'mdh-header-break-word')]")
+TITLE_XPATH = etree.XPath("string(//title)")
+DETAIL_ITEMS_XPATH = etree.XPath("//div[contains(@class, 'mdh-details-block__item')]")
+DETAIL_HEADER_XPATH = etree.XPath(".//div[contains(@class, 'mdh-details-block__header')]")
+DETAIL_CONTENT_XPATH = etree.XPath(".//div[contains(@class, 'mdh-details-block__content')]")
+TEXT_SECTIONS_XPATH = etree.XPath("//div[contains(@class, 'mdh-text-section')]")
+COURSE_SECTION_HEADER_XPATH = etree.XPath("(.//h2)[1]")
+PROGRAM_SECTION_HEADER_XPATH = etree.XPath("(.//h2 | .//h3)[1]")
+# Body text of a section = everything under its non-header children, gathered
+# in one XPath call instead of a Python-level walk over the header's siblings
+COURSE_SECTION_BODY_XPATH = etree.XPath("./*[not(self::h2)]//text()")
+PROGRAM_SECTION_BODY_XPATH = etree.XPath("./*[not(self::h2 or self::h3)]//text()")
+PARAGRAPHS_XPATH = etree.XPath(".//p")
+
+# Course sections whose body text is never extracted
+SKIP_HEADERS = frozenset({"betyg", "undervisning", "litteraturlistor"})
+
+# Banner phrases marking plans that are no longer given; checked against the
+# raw HTML (C-level substring search) instead of walking every text node
+COURSE_INACTIVE_TEXT = "Denna kursplan är inte aktuell och ges inte längre"
+PROGRAM_INACTIVE_TEXT = "Denna utbildningsplan är inte aktuell och ges inte längre"
+
+def _text(element) -> str:
+    # Whitespace-collapsed equivalent of BeautifulSoup's get_text(strip=True)
+    return " ".join(element.text_content().split())
+
+SWEDISH_INDICATORS = [
+    "huvudsakliga undervisningsspråket är svenska",
+    "undervisning sker på svenska",
+    "undervisningen sker på svenska",
+    "undervisningen genomförs på svenska",
+    "programmet ges på svenska",
+    "programmet genomförs på svenska",
+    "examination sker på svenska"
+]
+
+ENGLISH_INDICATORS = [
+    "huvudsakliga undervisningsspråket är engelska",
+    "undervisning sker på engelska",
+    "undervisningen sker på engelska",
+    "undervisningen genomförs på engelska",
+    "programmet ges på engelska",
+    "programmet genomförs på engelska",
+    "examination sker på engelska",
+    "kurslitteraturen är på engelska",
+    "litteraturen är på engelska"
+]
+
+# Single Aho-Corasick automaton so detect_languages can match every
+# indicator in one linear pass over the text instead of ~16 substring scans.
+# The bare language words are "fallback" patterns, only used when no full
+# indicator phrase matched.
+LANGUAGE_AUTOMATON = ahocorasick.Automaton()
+for _indicator in SWEDISH_INDICATORS:
+    LANGUAGE_AUTOMATON.add_word(_indicator, ("svenska", "primary"))
+for _indicator in ENGLISH_INDICATORS:
+    LANGUAGE_AUTOMATON.add_word(_indicator, ("engelska", "primary"))
+LANGUAGE_AUTOMATON.add_word("svenska", ("svenska", "fallback"))
+LANGUAGE_AUTOMATON.add_word("engelska", ("engelska", "fallback"))
+LANGUAGE_AUTOMATON.make_automaton()
+
+# Optional Hyperscan backend: the same indicator set compiled into one
+# SIMD-accelerated DFA over the raw bytes. python-hyperscan only ships for
+# x86-64 Linux, so the Aho-Corasick automaton above stays as the fallback.
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+LANGUAGE_PATTERNS = (
+    [(indicator, ("svenska", "primary")) for indicator in SWEDISH_INDICATORS]
+    + [(indicator, ("engelska", "primary")) for indicator in ENGLISH_INDICATORS]
+    + [("svenska", ("svenska", "fallback")), ("engelska", ("engelska", "fallback"))]
+)
+
+if hyperscan is not None:
+    LANGUAGE_DB = hyperscan.Database()
+    LANGUAGE_DB.compile(
+        expressions=[re.escape(pattern).encode() for pattern, _ in LANGUAGE_PATTERNS],
+        ids=list(range(len(LANGUAGE_PATTERNS)))
+    )
+else:
+    LANGUAGE_DB = None
 
 class UnifiedMDUCrawler:
     def __init__(
@@ -28,7 +132,8 @@ class UnifiedMDUCrawler:
         min_delay: float = 2.0,
         max_delay: float = 5.0,
         verbose: bool = False,
-        no_delay: bool = False
+        no_delay: bool = False,
+        concurrency: int = 20
     ):
         self.base_urls = {
             'course': "https://www.mdu.se/utbildning/kursplan",
@@ -44,16 +149,18 @@ class UnifiedMDUCrawler:
         self.max_delay = max_delay
         self.verbose = verbose
         self.no_delay = no_delay
+        self.concurrency = concurrency
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.html_dir.mkdir(parents=True, exist_ok=True)
-        self.session = requests.Session()
+        self.session = None  # aiohttp.ClientSession, created inside crawl()
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0'
         ]
         self.setup_logging()
-        self.items_by_code = defaultdict(lambda: {"giltig_fran": datetime.min})
+        self.items_by_code = {}
+        self.fetch_count = 0
 
     def setup_logging(self):
         log_file = self.output_dir / 'crawler.log'
@@ -68,152 +175,154 @@ class UnifiedMDUCrawler:
         self.logger = logging.getLogger(__name__)
 
     def rotate_user_agent(self):
-        new_agent = random.choice(self.user_agents)
-        self.session.headers.update({'User-Agent': new_agent})
-        self.logger.debug(f"Rotated user agent to: {new_agent}")
+        self.fetch_count += 1
+        if self.fetch_count % USER_AGENT_ROTATE_EVERY == 0:
+            new_agent = random.choice(self.user_agents)
+            self.session.headers['User-Agent'] = new_agent
+            self.logger.debug(f"Rotated user agent to: {new_agent}")
 
-    def smart_delay(self):
+    async def smart_delay(self):
         if not self.no_delay:
             delay = random.uniform(self.min_delay, self.max_delay)
             if self.verbose:
                 self.logger.info(f"Waiting {delay:.2f} seconds")
-            time.sleep(delay)
+            await asyncio.sleep(delay)
 
-    def fetch_page(self, item_id: int) -> Optional[str]:
+    async def fetch_page(self, item_id: int) -> Optional[str]:
         url = f"{self.base_url}?id={item_id}"
         self.logger.info(f"Fetching {self.crawl_type} ID: {item_id}")
         try:
             self.rotate_user_agent()
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            if "$details.name" not in response.text:
-                return response.text
-            return None
+            async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                response.raise_for_status()
+                body = await response.read()
+            # Check the sentinel on the raw bytes so placeholder pages are
+            # discarded without ever paying for the UTF-8 decode
+            if b"$details.name" in body:
+                return None
+            return body.decode('utf-8')
         except Exception as e:
             self.logger.error(f"Error fetching {self.crawl_type} ID {item_id}: {str(e)}")
             return None
 
-    def save_html(self, item_id: int, content: str):
+    async def save_html(self, item_id: int, content: str):
         file_path = self.html_dir / f"{item_id}.html"
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
+            await f.write(content)
         self.logger.info(f"Saved HTML for {self.crawl_type} ID {item_id}")
 
-    def extract_date(self, date_str: str) -> Optional[datetime]:
-        try:
-            return datetime.strptime(date_str.strip(), "%Y-%m-%d")
-        except ValueError:
-            import re
-            match = re.match(r"(Hösttermin|Vårtermin) (\d{4})", date_str)
-            if match:
-                year = int(match.group(2))
-                month = 8 if match.group(1) == "Hösttermin" else 1
-                return datetime(year, month, 1)
+    def extract_date_key(self, date_str: str) -> Optional[int]:
+        # Integer fingerprint (year*10000 + month*100 + day) that orders the
+        # same as the full date but needs no datetime allocation per record
+        parts = date_str.strip().split('-')
+        if len(parts) == 3 and all(part.isdigit() for part in parts):
+            year, month, day = (int(part) for part in parts)
+            if 1 <= month <= 12 and 1 <= day <= 31:
+                return year * 10000 + month * 100 + day
+        match = SEMESTER_RE.match(date_str)
+        if match:
+            year = int(match.group(2))
+            month = 8 if match.group(1) == "Hösttermin" else 1
+            return year * 10000 + month * 100 + 1
         return None
 
-    def detect_languages(self, text: str) -> List[str]:
+    @staticmethod
+    def date_key_to_iso(key: int) -> str:
+        return f"{key // 10000:04d}-{key // 100 % 100:02d}-{key % 100:02d}T00:00:00"
+
+    @staticmethod
+    def detect_languages(text: str) -> List[str]:
         text = text.lower()
-        languages = set()
-        
-        swedish_indicators = [
-            "huvudsakliga undervisningsspråket är svenska",
-            "undervisning sker på svenska",
-            "undervisningen sker på svenska",
-            "undervisningen genomförs på svenska",
-            "programmet ges på svenska",
-            "programmet genomförs på svenska",
-            "examination sker på svenska"
-        ]
-        
-        english_indicators = [
-            "huvudsakliga undervisningsspråket är engelska",
-            "undervisning sker på engelska",
-            "undervisningen sker på engelska",
-            "undervisningen genomförs på engelska",
-            "programmet ges på engelska",
-            "programmet genomförs på engelska",
-            "examination sker på engelska",
-            "kurslitteraturen är på engelska",
-            "litteraturen är på engelska"
-        ]
-        
-        for indicator in swedish_indicators:
-            if indicator in text:
-                languages.add("svenska")
-                break
-        
-        for indicator in english_indicators:
-            if indicator in text:
-                languages.add("engelska")
-                break
-        
-        if not languages:
-            if "svenska" in text:
-                languages.add("svenska")
-            if "engelska" in text:
-                languages.add("engelska")
-        
-        return sorted(list(languages))
-
-    def extract_course_info(self, html_content: str, course_id: int) -> Dict[str, Any]:
-        soup = BeautifulSoup(html_content, 'html.parser')
+        sv_primary = en_primary = False
+        sv_fallback = en_fallback = False
+
+        if LANGUAGE_DB is not None:
+            hits = []
+            LANGUAGE_DB.scan(
+                text.encode(),
+                match_event_handler=lambda pattern_id, start, end, flags, ctx:
+                    hits.append(LANGUAGE_PATTERNS[pattern_id][1])
+            )
+        else:
+            hits = [payload for _, payload in LANGUAGE_AUTOMATON.iter(text)]
+
+        for language, tier in hits:
+            if tier == "primary":
+                if language == "svenska":
+                    sv_primary = True
+                else:
+                    en_primary = True
+            elif language == "svenska":
+                sv_fallback = True
+            else:
+                en_fallback = True
+
+        if sv_primary or en_primary:
+            has_sv, has_en = sv_primary, en_primary
+        else:
+            has_sv, has_en = sv_fallback, en_fallback
+
+        # Fixed order matches the old sorted() output ("engelska" < "svenska")
+        return [language for language, found in (("engelska", has_en), ("svenska", has_sv)) if found]
+
+    @staticmethod
+    def extract_course_info(html_content: str, course_id: int) -> Dict[str, Any]:
+        try:
+            tree = lxml.html.fromstring(html_content)
+        except etree.ParserError:
+            # Empty or unparseable body; costs one item, not the crawl
+            return {'source_id': str(course_id), 'is_valid': False}
         course_data = {}
-        name = soup.find('h1', class_="mdh-header-break-word")
-        if name is not None:
-            course_data['name'] = name.text[11:]
-        
-        inactive_text = soup.find(text="Denna kursplan är inte aktuell och ges inte längre")
-        course_data['is_active'] = False if inactive_text else True
-        
-        details_block = soup.find('div', class_='mdh-details-block')
-        if details_block:
-            detail_items = details_block.find_all('div', class_='mdh-details-block__item')
-            for item in detail_items:
-                header = item.find('div', class_='mdh-details-block__header')
-                content = item.find('div', class_='mdh-details-block__content')
-                if header and content and "visa tidigare/senare versioner" not in header.get_text(strip=True).lower():
-                    key = header.get_text(strip=True).lower()
-                    value = content.get_text(strip=True)
-                    course_data[key] = value
-
-        text_sections = soup.find_all('div', class_='mdh-text-section')
-        for section in text_sections:
-            header = section.find(['h2'])
-            if header:
-                key = header.get_text(strip=True).lower()
+        name = H1_XPATH(tree)
+        if name:
+            course_data['name'] = name[0].text_content()[11:]
+
+        course_data['is_active'] = COURSE_INACTIVE_TEXT not in html_content
+
+        for item in DETAIL_ITEMS_XPATH(tree):
+            header = DETAIL_HEADER_XPATH(item)
+            content = DETAIL_CONTENT_XPATH(item)
+            if header and content:
+                key = _text(header[0]).lower()
+                if "visa tidigare/senare versioner" not in key:
+                    course_data[key] = _text(content[0])
+
+        for section in TEXT_SECTIONS_XPATH(tree):
+            headers = COURSE_SECTION_HEADER_XPATH(section)
+            if headers:
+                header = headers[0]
+                key = _text(header).lower()
                 if key == "examination":
-                    paragraphs = section.find_all('p')
+                    paragraphs = PARAGRAPHS_XPATH(section)
                     if paragraphs:
-                        course_data["examination"] = paragraphs[0].get_text(" ", strip=True)
+                        course_data["examination"] = _text(paragraphs[0])
                         continue
                 if key == "innehåll":
-                    paragraphs = section.find_all('p')
+                    paragraphs = PARAGRAPHS_XPATH(section)
                     if paragraphs:
-                        course_data["innehåll"] = " ".join(p.get_text(" ", strip=True) for p in paragraphs)
+                        course_data["innehåll"] = " ".join(_text(p) for p in paragraphs)
                         continue
-                if key not in {"betyg", "undervisning", "litteraturlistor"}:
-                    content = []
-                    for sibling in header.next_siblings:
-                        if sibling.name == 'h2':
-                            break
-                        if sibling.string and sibling.string.strip():
-                            content.append(sibling.string.strip())
+                if key not in SKIP_HEADERS:
+                    content = [text.strip() for text in COURSE_SECTION_BODY_XPATH(section) if text.strip()]
                     if content:
                         course_data[key] = " ".join(content)
-        
+
         course_data['source_id'] = str(course_id)
         return course_data
 
-    def extract_program_info(self, html_content: str, program_id: int) -> Dict[str, Any]:
-        soup = BeautifulSoup(html_content, 'html.parser')
+    @staticmethod
+    def extract_program_info(html_content: str, program_id: int) -> Dict[str, Any]:
+        try:
+            tree = lxml.html.fromstring(html_content)
+        except etree.ParserError:
+            # Empty or unparseable body; costs one item, not the crawl
+            return {'source_id': str(program_id), 'is_valid': False}
         program_data = {}
 
-        title_element = soup.find('title')
-        if title_element:
-            title_text = title_element.text.strip()
-            if "$details.name" in title_text:
-                return {'source_id': str(program_id), 'is_valid': False}
-            
+        title_text = TITLE_XPATH(tree).strip()
+        if "$details.name" in title_text:
+            return {'source_id': str(program_id), 'is_valid': False}
+
         if "Utbildningsplan -" in title_text:
             program_name = title_text.split("Utbildningsplan -")[1].strip()
             program_name = program_name.replace("- Mälardalens Universitet", "").replace("- Mälardalens universitet", "").strip()
@@ -221,54 +330,45 @@ class UnifiedMDUCrawler:
         else:
             program_data['name'] = title_text.replace("- Mälardalens Universitet", "").replace("- Mälardalens universitet", "").strip()
 
-        inactive_text = soup.find(text="Denna utbildningsplan är inte aktuell och ges inte längre")
-        program_data['is_active'] = False if inactive_text else True
+        program_data['is_active'] = PROGRAM_INACTIVE_TEXT not in html_content
 
-        details_block = soup.find('div', class_='mdh-details-block')
-        if details_block:
-            for item in details_block.find_all('div', class_='mdh-details-block__item'):
-                header = item.find('div', class_='mdh-details-block__header')
-                content = item.find('div', class_='mdh-details-block__content')
-                if header and content:
-                    key = header.get_text(strip=True).lower()
-                    if "version" not in key.lower():
-                        value = content.get_text(strip=True)
-                        program_data[key] = value
+        for item in DETAIL_ITEMS_XPATH(tree):
+            header = DETAIL_HEADER_XPATH(item)
+            content = DETAIL_CONTENT_XPATH(item)
+            if header and content:
+                key = _text(header[0]).lower()
+                if "version" not in key:
+                    program_data[key] = _text(content[0])
 
         goal_sections = {
             'kunskap och förståelse': [],
             'färdighet och förmåga': [],
             'värderingsförmåga och förhållningssätt': []
         }
-        text_sections = soup.find_all('div', class_='mdh-text-section')
         current_year = None
         year_contents = defaultdict(list)
         found_language_section = False
-        
-        for section in text_sections:
-            header = section.find(['h2', 'h3'])
-            if not header:
+
+        for section in TEXT_SECTIONS_XPATH(tree):
+            headers = PROGRAM_SECTION_HEADER_XPATH(section)
+            if not headers:
                 continue
-            header_text = header.get_text(strip=True).lower()
+            header = headers[0]
+            header_text = _text(header).lower()
             if header_text == "innehåll":
-                paragraphs = section.find_all('p')
+                paragraphs = PARAGRAPHS_XPATH(section)
                 if paragraphs:
-                    program_data["innehåll"] = " ".join(p.get_text(" ", strip=True) for p in paragraphs)
+                    program_data["innehåll"] = " ".join(_text(p) for p in paragraphs)
                     continue
             if "årskurs" in header_text:
                 current_year = header_text
                 continue
-            content = []
-            for sibling in header.next_siblings:
-                if sibling.name in ['h2', 'h3']:
-                    break
-                if sibling.string and sibling.string.strip():
-                    content.append(sibling.string.strip())
+            content = [text.strip() for text in PROGRAM_SECTION_BODY_XPATH(section) if text.strip()]
             if content:
                 content_text = " ".join(content)
                 if header_text == "undervisningsspråk":
                     found_language_section = True
-                    program_data['undervisningsspråk'] = self.detect_languages(content_text)
+                    program_data['undervisningsspråk'] = UnifiedMDUCrawler.detect_languages(content_text)
                 elif current_year:
                     year_contents[current_year].append(content_text)
                 elif header_text in goal_sections:
@@ -287,75 +387,122 @@ class UnifiedMDUCrawler:
         program_data['source_id'] = str(program_id)
         return program_data
 
-    def crawl(self):
+    @staticmethod
+    def extract_item_info(crawl_type: str, html_content: str, item_id: int) -> Dict[str, Any]:
+        # Static entry point so worker processes can run extraction without
+        # pickling the crawler instance
+        if crawl_type == 'course':
+            return UnifiedMDUCrawler.extract_course_info(html_content, item_id)
+        return UnifiedMDUCrawler.extract_program_info(html_content, item_id)
+
+    def process_item(self, item_id: int, item_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if not item_data.get('is_valid', True):
+            return None
+
+        item_data["url"] = f"{self.base_url}?id={item_id}"
+
+        identifier_key = 'kurskod' if self.crawl_type == 'course' else 'programkod'
+        date_field = 'giltig från'
+
+        code = item_data.get(identifier_key)
+        date_str = item_data.get(date_field)
+
+        if code and date_str:
+            date_key = self.extract_date_key(date_str)
+            if date_key:
+                prev = self.items_by_code.get(code)
+                if prev is None or date_key > prev.giltig_fran:
+                    self.items_by_code[code] = Version(
+                        code=code,
+                        title=item_data.get('title', ''),
+                        name=item_data.get('name', '') if self.crawl_type == 'program' else '',
+                        giltig_fran=date_key,
+                        id=item_id,
+                        is_active=item_data.get('is_active', True)
+                    )
+                    self.logger.info(f"Found newer version of {code}: {date_str}")
+
+        return item_data
+
+    async def crawl(self):
         self.logger.info(f"Starting {self.crawl_type} crawl from ID {self.start_id} to {self.end_id}")
         self.logger.info(f"Delay between requests: {'Disabled' if self.no_delay else f'{self.min_delay}-{self.max_delay} seconds'}")
-        
+
         items_path = self.output_dir / f'{self.crawl_type}s.jsonl'
         newest_versions_path = self.output_dir / 'newest_versions.jsonl'
-        
-        def datetime_handler(obj):
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            raise TypeError(f'Object of type {type(obj)} is not JSON serializable')
 
         self.items_by_code.clear()
 
-        with open(items_path, 'w', encoding='utf-8') as items_file:
-            for item_id in tqdm(range(self.start_id, self.end_id + 1)):
-                content = self.fetch_page(item_id)
+        ids = list(range(self.start_id, self.end_id + 1))
+        semaphore = asyncio.Semaphore(self.concurrency)
+        out_queue = asyncio.Queue(maxsize=512)
+        progress = tqdm(total=len(ids))
+        loop = asyncio.get_running_loop()
+
+        async def worker(pool, item_id: int):
+            async with semaphore:
+                content = await self.fetch_page(item_id)
+                await self.smart_delay()
+            try:
                 if content:
-                    self.save_html(item_id, content)
-                    
-                    if self.crawl_type == 'course':
-                        item_data = self.extract_course_info(content, item_id)
-                    else:
-                        item_data = self.extract_program_info(content, item_id)
-
-                    if not item_data.get('is_valid', True):
-                        continue
-
-                    item_data["url"] = f"{self.base_url}?id={item_id}"
-
-                    identifier_key = 'kurskod' if self.crawl_type == 'course' else 'programkod'
-                    date_key = 'giltig från'
-                    
-                    code = item_data.get(identifier_key)
-                    date_str = item_data.get(date_key)
-                    
-                    if code and date_str:
-                        date = self.extract_date(date_str)
-                        if date:
-                            current_data = {
-                                'code': code,
-                                'title': item_data.get('title', ''),
-                                'name': item_data.get('name', '') if self.crawl_type == 'program' else '',
-                                'giltig_fran': date,
-                                'id': item_id,
-                                'is_active': item_data.get('is_active', True)
-                            }
-                            
-                            if date > self.items_by_code[code].get('giltig_fran', datetime.min):
-                                self.items_by_code[code] = current_data
-                                self.logger.info(f"Found newer version of {code}: {date}")
-                    
-                    json.dump(item_data, items_file, ensure_ascii=False, default=datetime_handler)
-                    items_file.write('\n')
-                
-                self.smart_delay()
-
-        with open(newest_versions_path, 'w', encoding='utf-8') as f:
-            for code, item_data in self.items_by_code.items():
+                    await self.save_html(item_id, content)
+                    # HTML parsing is CPU-bound and GIL-serialized; run it in the
+                    # process pool so it scales across cores while the loop keeps
+                    # the sockets busy
+                    item_data = await loop.run_in_executor(
+                        pool, UnifiedMDUCrawler.extract_item_info, self.crawl_type, content, item_id)
+                    item_data = self.process_item(item_id, item_data)
+                    if item_data:
+                        await out_queue.put(orjson.dumps(item_data, option=orjson.OPT_APPEND_NEWLINE))
+            except Exception as e:
+                # One bad page must not take down the gather and the writer with it
+                self.logger.error(f"Error processing {self.crawl_type} ID {item_id}: {str(e)}")
+            finally:
+                progress.update(1)
+
+        # Single writer so concurrent workers never interleave JSONL records;
+        # records arrive pre-serialized and are flushed in ~64 KiB batches
+        async def writer(items_file):
+            buffer = bytearray()
+            while True:
+                chunk = await out_queue.get()
+                if chunk is None:
+                    break
+                buffer += chunk
+                if len(buffer) >= WRITE_BUFFER_SIZE:
+                    await items_file.write(bytes(buffer))
+                    buffer.clear()
+            if buffer:
+                await items_file.write(bytes(buffer))
+
+        connector = aiohttp.TCPConnector(limit=50, limit_per_host=25)
+        headers = {'User-Agent': random.choice(self.user_agents)}
+        with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+                self.session = session
+                async with aiofiles.open(items_path, 'wb') as items_file:
+                    writer_task = asyncio.create_task(writer(items_file))
+                    try:
+                        await asyncio.gather(*(worker(pool, item_id) for item_id in ids))
+                    finally:
+                        # Always flush the writer's buffer, even if the gather
+                        # is aborted, before the file handle closes
+                        await out_queue.put(None)
+                        await writer_task
+        progress.close()
+
+        with open(newest_versions_path, 'wb') as f:
+            for code, version in self.items_by_code.items():
                 if code:
-                    json.dump({
-                        'code': code,
-                        'title': item_data.get('title', ''),
-                        'name': item_data.get('name', ''),
-                        'giltig_fran': item_data['giltig_fran'].isoformat() if item_data.get('giltig_fran') else None,
-                        'id': item_data.get('id'),
-                        'is_active': item_data.get('is_active', True)
-                    }, f, ensure_ascii=False)
-                    f.write('\n')
+                    # Only the winning entry per code is converted back to ISO
+                    f.write(orjson.dumps({
+                        'code': version.code,
+                        'title': version.title,
+                        'name': version.name,
+                        'giltig_fran': self.date_key_to_iso(version.giltig_fran),
+                        'id': version.id,
+                        'is_active': version.is_active
+                    }, option=orjson.OPT_APPEND_NEWLINE))
 
         self.logger.info(f"Crawling completed. Results saved to:")
         self.logger.info(f"- {self.crawl_type.title()} data: {items_path}")
@@ -363,6 +510,14 @@ class UnifiedMDUCrawler:
         self.logger.info(f"- HTML files: {self.html_dir}")
 
 def main():
+    # uvloop is a drop-in replacement for asyncio's selector loop with much
+    # lower syscall overhead; it is Unix-only, so fall back silently elsewhere
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     parser = argparse.ArgumentParser(description='Unified MDU Course and Program Crawler')
     parser.add_argument('--course-range', nargs=2, type=int, metavar=('START', 'END'),
                       help='Start and end IDs for course crawling (e.g., --course-range 25000 35000)')
@@ -378,6 +533,8 @@ def main():
                       help='Enable verbose logging')
     parser.add_argument('--no-delay', action='store_true',
                       help='Disable delay between requests')
+    parser.add_argument('--concurrency', type=int, default=20,
+                      help='Maximum number of concurrent requests (default: 20)')
 
     args = parser.parse_args()
 
@@ -394,9 +551,10 @@ def main():
             min_delay=args.min_delay,
             max_delay=args.max_delay,
             verbose=args.verbose,
-            no_delay=args.no_delay
+            no_delay=args.no_delay,
+            concurrency=args.concurrency
         )
-        course_crawler.crawl()
+        asyncio.run(course_crawler.crawl())
 
     if args.program_range:
         print(f"\nStarting crawl for programs from ID {args.program_range[0]} to {args.program_range[1]}")
@@ -408,9 +566,10 @@ def main():
             min_delay=args.min_delay,
             max_delay=args.max_delay,
             verbose=args.verbose,
-            no_delay=args.no_delay
+            no_delay=args.no_delay,
+            concurrency=args.concurrency
         )
-        program_crawler.crawl()
+        asyncio.run(program_crawler.crawl())
 
 
 if __name__ == "__main__":
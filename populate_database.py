@@ -1,7 +1,53 @@
 from langchain_ollama import OllamaEmbeddings
 from langchain_chroma import Chroma
 from langchain_community.document_loaders import JSONLoader
-from uuid import uuid4
+from uuid import uuid5, NAMESPACE_URL
+import asyncio
+import ollama
+
+EMBED_MODEL = "REPLACE_WITH_EMBEDDING_MODEL"
+BATCH_SIZE = 64
+EMBED_CONCURRENCY = 8
+INSERT_BATCH_SIZE = 512
+
+async def embed_batches(text_batches):
+    # Keep up to EMBED_CONCURRENCY batch requests in flight against the local
+    # Ollama server so it is never idle between roundtrips; gather preserves
+    # batch order
+    client = ollama.AsyncClient()
+    semaphore = asyncio.Semaphore(EMBED_CONCURRENCY)
+
+    async def embed_batch(texts):
+        async with semaphore:
+            response = await client.embed(model=EMBED_MODEL, input=texts)
+            return response["embeddings"]
+
+    return await asyncio.gather(*(embed_batch(texts) for texts in text_batches))
+
+def add_documents_batched(vector_store, docs, batch_size=BATCH_SIZE):
+    # Embed batch_size documents per Ollama roundtrip and insert them with the
+    # precomputed vectors, instead of letting add_documents embed one doc at a time
+    batches = [docs[start:start + batch_size] for start in range(0, len(docs), batch_size)]
+    embeddings_per_batch = asyncio.run(
+        embed_batches([[doc.page_content for doc in batch] for batch in batches])
+    )
+    texts = [doc.page_content for doc in docs]
+    metadatas = [doc.metadata for doc in docs]
+    embeddings = [embedding for batch in embeddings_per_batch for embedding in batch]
+
+    # Stream inserts in bounded chunks instead of one mega-transaction.
+    # Deterministic uuid5 ids (source file + record number, both set by
+    # JSONLoader) make re-runs after a partial failure idempotent: upsert
+    # overwrites the same ids instead of inserting duplicates
+    for start in range(0, len(docs), INSERT_BATCH_SIZE):
+        end = start + INSERT_BATCH_SIZE
+        vector_store._collection.upsert(
+            ids=[str(uuid5(NAMESPACE_URL, f"{doc.metadata.get('source')}:{doc.metadata.get('seq_num')}"))
+                 for doc in docs[start:end]],
+            documents=texts[start:end],
+            metadatas=metadatas[start:end],
+            embeddings=embeddings[start:end],
+        )
 
 def load_courses():
     def metadata_func(record: dict, metadata: dict) -> dict:
@@ -13,10 +59,10 @@ def load_courses():
     loader = JSONLoader(file_path=path, json_lines=True, text_content=False, jq_schema=".", metadata_func=metadata_func)
     docs = loader.load()
 
-    embed_model = OllamaEmbeddings(model="REPLACE_WITH_EMBEDDING_MODEL")
+    embed_model = OllamaEmbeddings(model=EMBED_MODEL)
     
     vector_store = Chroma(embedding_function=embed_model, persist_directory="./chroma") # Change persist_directory if you want another path for ChromaDB
-    vector_store.add_documents(docs)
+    add_documents_batched(vector_store, docs)
     print("Courses sucessfully added to DB")
 
 def load_programs():
@@ -29,10 +75,10 @@ def load_programs():
     loader = JSONLoader(file_path=path, json_lines=True, text_content=False, jq_schema=".", metadata_func=metadata_func)
     docs = loader.load()
 
-    embed_model = OllamaEmbeddings(model="REPLACE_WITH_EMBEDDING_MODEL")
+    embed_model = OllamaEmbeddings(model=EMBED_MODEL)
     
     vector_store = Chroma(embedding_function=embed_model, persist_directory="./chroma") # Change persist_directory if you want another path for ChromaDB
-    vector_store.add_documents(docs)
+    add_documents_batched(vector_store, docs)
     print("Programs sucessfully added to DB")
 
 
@@ -1,17 +1,27 @@
+import functools
+
 from langchain_ollama import OllamaEmbeddings
 
 class Retriever:
     def __init__(self, chroma_client, embed_model):
         self.embed_model = embed_model
         self.db = chroma_client
+        # Per-instance LRU: repeated prompts skip the Ollama embedding roundtrip.
+        # (functools.lru_cache cannot wrap the method directly since OllamaEmbeddings
+        # instances are not hashable, so the cache is bound per Retriever here.)
+        self._embed = functools.lru_cache(maxsize=512)(self._embed_query)
+
+    def _embed_query(self, prompt):
+        return tuple(self.embed_model.embed_query(prompt))
 
     # Query vector DB by course_code or program_code if provided, else fetch the 5 most relevant documents
     def query(self, prompt, course_code=None, program_code=None, num_codes=1):
+        embedding = list(self._embed(prompt))
         if course_code:
-            docs = self.db.similarity_search(prompt, k=num_codes, filter={"course_code": course_code[0]})
+            docs = self.db.similarity_search_by_vector(embedding, k=num_codes, filter={"course_code": course_code[0]})
         elif program_code:
-            docs = self.db.similarity_search(prompt, k=num_codes, filter={"program_code": program_code[0]})
+            docs = self.db.similarity_search_by_vector(embedding, k=num_codes, filter={"program_code": program_code[0]})
         else:
-            docs = self.db.similarity_search(prompt, k=5)
+            docs = self.db.similarity_search_by_vector(embedding, k=5)
 
-        return docs
\ No newline at end of file
+        return docs